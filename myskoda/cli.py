@@ -108,7 +108,7 @@ async def info(ctx: Context, vin: str) -> None:
     print(f"{colored("capabilities:", "blue")}")
     for capability in info.capabilities.capabilities:
         print(f"- {capability.id}")
-        if len(capability.statuses) != 0:
+        if capability.statuses:
             print("  status:")
             for status in capability.statuses:
                 print(f"  - {status}")
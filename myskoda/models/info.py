@@ -78,6 +78,9 @@ class CapabilityId(StrEnum):
     WINDOW_HEATING = "WINDOW_HEATING"
 
 
+_CAPABILITY_IDS: dict[str, CapabilityId] = {c.value: c for c in CapabilityId}
+
+
 class CapabilityStatus(StrEnum):
     DEACTIVATED_BY_ACTIVE_VEHICLE_USER = "DEACTIVATED_BY_ACTIVE_VEHICLE_USER"
     DISABLED_BY_USER = "DISABLED_BY_USER"
@@ -89,35 +92,68 @@ class CapabilityStatus(StrEnum):
     LOCATION_DATA_DISABLED = "LOCATION_DATA_DISABLED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Capability(DataClassORJSONMixin):
-    id: CapabilityId
-    statuses: list[CapabilityStatus]
+    id: CapabilityId = field(metadata=field_options(deserialize=_CAPABILITY_IDS.__getitem__))
+    statuses: tuple[CapabilityStatus, ...]
+    available: bool = field(
+        init=False, repr=False, compare=False, metadata=field_options(serialize="omit")
+    )
 
-    def is_available(self) -> bool:
-        """Check whether the capability can currently be used.
+    def __post_init__(self) -> None:
+        """Determine once whether the capability can currently be used.
 
         It looks like every status is an indication that the capability is not available.
         """
-        return not self.statuses
+        self.available = not self.statuses
+
+    def is_available(self) -> bool:
+        """Check whether the capability can currently be used."""
+        return self.available
 
 
 def drop_unknown_capabilities(value: list[dict]) -> list[Capability]:
     """Drop any unknown capabilities and log a message."""
-    unknown_capabilities = [c for c in value if c["id"] not in CapabilityId]
-    if unknown_capabilities:
-        _LOGGER.info(f"Dropping unknown capabilities: {unknown_capabilities}")
-    return [Capability.from_dict(c) for c in value if c["id"] in CapabilityId]
+    known_capabilities = []
+    unknown_ids = []
+    for c in value:
+        capability_id = c["id"]
+        if capability_id in _CAPABILITY_IDS:
+            known_capabilities.append(c)
+        else:
+            unknown_ids.append(capability_id)
+    if unknown_ids:
+        _LOGGER.info("Dropping unknown capability ids: %s", unknown_ids)
+    return [Capability.from_dict(c) for c in known_capabilities]
+
+
+@dataclass(slots=True)
+class Capabilities(DataClassORJSONMixin):
+    """Capabilities of a vehicle, indexed by their id.
 
+    The index is built once on construction, so the list must not be mutated afterwards.
+    """
 
-@dataclass
-class Capabilities(DataClassORJSONMixin):
     capabilities: list[Capability] = field(
         metadata=field_options(deserialize=drop_unknown_capabilities)
     )
+    _by_id: dict[CapabilityId, Capability] = field(
+        init=False, repr=False, compare=False, metadata=field_options(serialize="omit")
+    )
+
+    def __post_init__(self) -> None:
+        """Index the capabilities by their id for constant-time lookups.
+
+        If an id is listed more than once, an available entry is preferred.
+        """
+        self._by_id = {}
+        for capability in self.capabilities:
+            indexed = self._by_id.get(capability.id)
+            if indexed is None or (not indexed.available and capability.available):
+                self._by_id[capability.id] = capability
 
 
-@dataclass
+@dataclass(slots=True)
 class Battery(DataClassORJSONMixin):
     capacity: int = field(metadata=field_options(alias="capacityInKWh"))
 
@@ -133,7 +169,7 @@ class VehicleState(StrEnum):
     ACTIVATED = "ACTIVATED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Engine(DataClassORJSONMixin):
     type: str
     power: int = field(metadata=field_options(alias="powerInKW"))
@@ -142,12 +178,12 @@ class Engine(DataClassORJSONMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Gearbox(DataClassORJSONMixin):
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Specification(DataClassORJSONMixin):
     body: BodyType
     engine: Engine
@@ -164,7 +200,7 @@ class Specification(DataClassORJSONMixin):
     trim_level: str | None = field(default=None, metadata=field_options(alias="trimLevel"))
 
 
-@dataclass
+@dataclass(slots=True)
 class ServicePartner(DataClassORJSONMixin):
     id: str = field(metadata=field_options(alias="servicePartnerId"))
 
@@ -173,13 +209,13 @@ class ErrorType(StrEnum):
     MISSING_RENDER = "MISSING_RENDER"
 
 
-@dataclass
+@dataclass(slots=True)
 class Error(DataClassORJSONMixin):
     description: str
     type: ErrorType
 
 
-@dataclass
+@dataclass(slots=True)
 class Info(DataClassORJSONMixin):
     """Basic vehicle information."""
 
@@ -196,6 +232,13 @@ class Info(DataClassORJSONMixin):
     )
     license_plate: str | None = field(default=None, metadata=field_options(alias="licensePlate"))
     errors: list[Error] | None = field(default=None)
+    _model_name: str | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata=field_options(serialize="omit"),
+    )
 
     def has_capability(self, cap: CapabilityId) -> bool:
         """Check for a capability.
@@ -203,7 +246,7 @@ class Info(DataClassORJSONMixin):
         Checks whether a vehicle generally has a capability.
         Does not check whether it's actually available.
         """
-        return any(capability.id == cap for capability in self.capabilities.capabilities)
+        return cap in self.capabilities._by_id  # noqa: SLF001
 
     def is_capability_available(self, cap: CapabilityId) -> bool:
         """Check for capability availability.
@@ -212,15 +255,20 @@ class Info(DataClassORJSONMixin):
         available. A capability can be unavailable for example if it's deactivated
         by the currently active user.
         """
-        return any(
-            capability.id == cap and capability.is_available()
-            for capability in self.capabilities.capabilities
-        )
+        capability = self.capabilities._by_id.get(cap)  # noqa: SLF001
+        return capability is not None and capability.available
+
+    @property
+    def model_name(self) -> str:
+        """Return the name of the vehicle's model, building it on first access."""
+        if self._model_name is None:
+            model = self.specification.model
+            engine = self.specification.engine
+            model_year = self.specification.model_year
+            system_model_id = self.specification.system_model_id
+            self._model_name = f"{model} {engine} {model_year} ({system_model_id})"
+        return self._model_name
 
     def get_model_name(self) -> str:
         """Return the name of the vehicle's model."""
-        model = self.specification.model
-        engine = self.specification.engine
-        model_year = self.specification.model_year
-        system_model_id = self.specification.system_model_id
-        return f"{model} {engine} {model_year} ({system_model_id})"
+        return self.model_name
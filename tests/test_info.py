@@ -0,0 +1,86 @@
+"""Unit tests for myskoda.models.info."""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from myskoda.models.info import CapabilityId, Info
+
+FIXTURES_DIR = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.fixture(name="vehicle_info")
+def load_vehicle_info() -> dict:
+    """Load vehicle-info fixture."""
+    vehicle_info = (FIXTURES_DIR / "superb/garage_vehicles_LK_liftback.json").read_text()
+    return json.loads(vehicle_info)
+
+
+def test_has_capability(vehicle_info: dict) -> None:
+    """Test checking whether a vehicle has a capability."""
+    info = Info.from_dict(vehicle_info)
+    assert info.has_capability(CapabilityId.STATE)
+    assert info.has_capability(CapabilityId.NEWS)
+    assert not info.has_capability(CapabilityId.PLUG_AND_CHARGE)
+
+
+def test_is_capability_available(vehicle_info: dict) -> None:
+    """Test checking whether a capability is available."""
+    info = Info.from_dict(vehicle_info)
+    assert info.is_capability_available(CapabilityId.STATE)
+    assert not info.is_capability_available(CapabilityId.NEWS)
+    assert not info.is_capability_available(CapabilityId.PLUG_AND_CHARGE)
+
+
+def test_is_capability_available_repeated_id(vehicle_info: dict) -> None:
+    """Test that any available entry of a repeated capability id counts."""
+    capabilities = vehicle_info["capabilities"]["capabilities"]
+    capabilities.insert(0, {"id": "STATE", "statuses": ["LICENSE_MISSING"]})
+    capabilities.append({"id": "NEWS", "statuses": []})
+    capabilities.append({"id": "NEWS", "statuses": ["LICENSE_EXPIRED"]})
+    info = Info.from_dict(vehicle_info)
+    assert info.is_capability_available(CapabilityId.STATE)
+    assert info.is_capability_available(CapabilityId.NEWS)
+
+
+def test_capability_available(vehicle_info: dict) -> None:
+    """Test that availability is derived from the capability statuses."""
+    info = Info.from_dict(vehicle_info)
+    capabilities = {c.id: c for c in info.capabilities.capabilities}
+    news = capabilities[CapabilityId.NEWS]
+    assert isinstance(news.statuses, tuple)
+    assert news.available is False
+    assert capabilities[CapabilityId.STATE].available is True
+
+
+def test_unknown_capabilities_dropped(vehicle_info: dict) -> None:
+    """Test that unknown capabilities are dropped while deserializing."""
+    vehicle_info["capabilities"]["capabilities"].append(
+        {"id": "SOME_FUTURE_CAPABILITY", "statuses": []}
+    )
+    info = Info.from_dict(vehicle_info)
+    assert "SOME_FUTURE_CAPABILITY" not in [c.id for c in info.capabilities.capabilities]
+    assert info.has_capability(CapabilityId.STATE)
+
+
+def test_get_model_name(vehicle_info: dict) -> None:
+    """Test building the model name from the specification."""
+    info = Info.from_dict(vehicle_info)
+    assert (
+        info.get_model_name()
+        == "Superb Engine(type='TSI iV', power=160, capacity_in_liters=1.4) 2020 (3V35XC)"
+    )
+    assert info.model_name == info.get_model_name()
+
+
+def test_unknown_capabilities_logged(vehicle_info: dict, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that only the ids of dropped capabilities are logged."""
+    vehicle_info["capabilities"]["capabilities"].append(
+        {"id": "SOME_FUTURE_CAPABILITY", "statuses": ["LICENSE_MISSING"]}
+    )
+    with caplog.at_level(logging.INFO, logger="myskoda.models.info"):
+        Info.from_dict(vehicle_info)
+    assert "Dropping unknown capability ids: ['SOME_FUTURE_CAPABILITY']" in caplog.text
+    assert "LICENSE_MISSING" not in caplog.text